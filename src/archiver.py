@@ -3,23 +3,60 @@ Post Archiver Module
 Wrapper around yt-community-post-archiver with additional functionality.
 """
 
-import json
+import logging
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
-from .utils import parse_relative_date, sanitize_filename
+from .utils import (
+    json_dumps_bytes,
+    json_loads_bytes,
+    parse_archived_timestamp,
+    parse_relative_date,
+    sanitize_filename,
+)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Collects the ID of every community post link currently rendered on the
+# page in a single WebDriver round-trip.
+_COLLECT_POST_IDS_JS = r"""
+const ids = [];
+document.querySelectorAll('a[href*="/post/"]').forEach((a) => {
+    const match = a.href.match(/\/post\/([^?#\/]+)/);
+    if (match) ids.push(match[1]);
+});
+return ids;
+"""
+
+# Counts rendered community post links; used to wait for lazy-loaded content.
+_COUNT_POST_LINKS_JS = 'return document.querySelectorAll(\'a[href*="/post/"]\').length;'
+
+# Keeps streamed subprocess output line-coherent when two archiver runs
+# are draining concurrently.
+_print_lock = threading.Lock()
+
+# Matches the is_members flag in raw post.json bytes for in-place patching.
+_MEMBER_FALSE_RE = re.compile(rb'"is_members"\s*:\s*false')
+
+
+@dataclass(slots=True)
 class CommunityPost:
-    """Represents a single community post."""
+    """Represents a single community post.
+
+    Slots matter here: archives hold thousands of these and the
+    processor's filter/stat loops are mostly attribute reads, so skipping
+    the per-instance __dict__ trims both memory and lookup cost.
+    """
     
     post_id: str
     url: str
@@ -34,21 +71,42 @@ class CommunityPost:
     num_thumbs_up: str = "0"
     poll: Optional[dict] = None
     when_archived: str = ""
-    
+    # Lazily cached lowercase text for repeated searches; a plain slot
+    # plus property since cached_property needs a __dict__
+    _text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Derived flags the stats/filter paths read repeatedly; computed once
+    # at construction so those loops do one attribute load per post
+    has_poll: bool = field(init=False, repr=False, compare=False)
+    has_image: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.has_poll = self.poll is not None
+        self.has_image = bool(self.images or self.local_images)
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased post text, computed once on first use."""
+        lowered = self._text_lower
+        if lowered is None:
+            lowered = self.text.lower()
+            self._text_lower = lowered
+        return lowered
+
     @classmethod
     def from_json(cls, data: dict, post_dir: Path) -> "CommunityPost":
         """Create a CommunityPost from JSON data."""
-        post_id = data.get("url", "").split("/")[-1] if data.get("url") else ""
+        url = data.get("url", "")
+        post_id = url.rsplit("/", 1)[-1] if url else ""
         
-        # Find local images
+        # Find local images in a single directory scan
         local_images = []
-        if post_dir.exists():
-            for img_file in post_dir.glob("*.jpg"):
-                local_images.append(img_file.name)
-            for img_file in post_dir.glob("*.png"):
-                local_images.append(img_file.name)
-            for img_file in post_dir.glob("*.webp"):
-                local_images.append(img_file.name)
+        try:
+            with os.scandir(post_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith((".jpg", ".png", ".webp")):
+                        local_images.append(entry.name)
+        except FileNotFoundError:
+            pass
         
         # Parse relative date to estimated date
         relative_date = data.get("relative_date", "")
@@ -56,7 +114,7 @@ class CommunityPost:
         
         return cls(
             post_id=post_id,
-            url=data.get("url", ""),
+            url=url,
             text=data.get("text", ""),
             images=data.get("images", []),
             local_images=local_images,
@@ -73,7 +131,12 @@ class CommunityPost:
 
 class PostArchiver:
     """Wrapper for yt-community-post-archiver functionality."""
-    
+
+    # Path suffixes recognized by the URL helpers, hoisted so they are not
+    # rebuilt on every call
+    _SUFFIXES_TO_STRIP = ("/posts", "/community", "/videos", "/about", "/channels")
+    _POST_URL_SUFFIXES = ("/posts", "/community")
+
     def __init__(
         self,
         output_dir: str = "archive-output",
@@ -90,6 +153,9 @@ class PostArchiver:
         self.cookies_file = str(Path(cookies_file).resolve()) if cookies_file else None
         self.driver = driver
         self.headless = headless
+        # Cached result of the post.json directory walk; invalidated whenever
+        # an archiver subprocess may have added posts
+        self._post_json_paths_cache: Optional[list[Path]] = None
     
     def _fetch_post_order_from_page(self, channel_url: str, max_posts: Optional[int] = None) -> list[str]:
         """
@@ -103,10 +169,11 @@ class PostArchiver:
         """
         try:
             from selenium import webdriver
-            from selenium.webdriver.common.by import By
+            from selenium.common.exceptions import TimeoutException
             from selenium.webdriver.chrome.options import Options as ChromeOptions
             from selenium.webdriver.firefox.options import Options as FirefoxOptions
-            
+            from selenium.webdriver.support.ui import WebDriverWait
+
             # Setup driver
             if self.driver == "firefox":
                 options = FirefoxOptions()
@@ -143,50 +210,60 @@ class PostArchiver:
                     self._load_cookies_to_driver(driver)
                     driver.refresh()
                 
-                time.sleep(3)  # Wait for page to load
-                
-                # Scroll and collect post IDs
-                max_same_count = 15
-                same_count = 0
-                last_count = 0
-                
+                # Wait for the first posts to render instead of a fixed sleep;
+                # a timeout here just means the channel has no visible posts
+                try:
+                    WebDriverWait(driver, 10).until(
+                        lambda d: d.execute_script(_COUNT_POST_LINKS_JS) > 0
+                    )
+                except TimeoutException:
+                    pass
+
+                # Scroll and collect post IDs; stop after a few consecutive
+                # waits in which no new content arrived
+                max_stalled = 3
+                stalled = 0
+
                 while True:
-                    # Find all post elements
-                    posts = driver.find_elements(By.ID, "post")
-                    
-                    for post in posts:
-                        try:
-                            # Find the post link to get the URL
-                            links = post.find_elements(By.TAG_NAME, "a")
-                            for link in links:
-                                href = link.get_attribute("href")
-                                if href and "/post/" in href:
-                                    post_id = href.split("/post/")[-1].split("?")[0]
-                                    if post_id and post_id not in seen:
-                                        seen.add(post_id)
-                                        post_ids.append(post_id)
-                                    break
-                        except:
-                            continue
-                    
+                    # Extract all post IDs on the page with one script call
+                    # instead of a WebDriver round-trip per anchor element
+                    try:
+                        found_ids = driver.execute_script(_COLLECT_POST_IDS_JS) or []
+                    except Exception:
+                        found_ids = []
+
+                    for post_id in found_ids:
+                        if post_id and post_id not in seen:
+                            seen.add(post_id)
+                            post_ids.append(post_id)
+
                     # Check if we've reached max posts
                     if max_posts and len(post_ids) >= max_posts:
                         break
-                    
-                    # Check if we're still finding new posts
-                    if len(post_ids) == last_count:
-                        same_count += 1
-                        if same_count >= max_same_count:
+
+                    # Jump straight to the bottom, then wait until either new
+                    # posts render or the page grows taller; incremental
+                    # 800px steps forced far more round-trips than needed
+                    link_count = len(found_ids)
+                    last_height = driver.execute_script(
+                        "return document.documentElement.scrollHeight"
+                    )
+                    driver.execute_script(
+                        "window.scrollTo(0, document.documentElement.scrollHeight);"
+                    )
+                    try:
+                        WebDriverWait(driver, 5).until(
+                            lambda d: d.execute_script(_COUNT_POST_LINKS_JS) > link_count
+                            or d.execute_script("return document.documentElement.scrollHeight")
+                            > last_height
+                        )
+                        stalled = 0
+                    except TimeoutException:
+                        stalled += 1
+                        if stalled >= max_stalled:
                             break
-                    else:
-                        same_count = 0
-                        last_count = len(post_ids)
-                    
-                    # Scroll down
-                    driver.execute_script("window.scrollBy(0, 800);")
-                    time.sleep(1)
                 
-                print(f"   預先獲取到 {len(post_ids)} 則貼文順序")
+                logger.info("   預先獲取到 %d 則貼文順序", len(post_ids))
                 
             finally:
                 driver.quit()
@@ -194,33 +271,47 @@ class PostArchiver:
             return post_ids
             
         except Exception as e:
-            print(f"Warning: Could not fetch post order: {e}")
+            logger.warning("Could not fetch post order: %s", e)
             return []
     
     def _load_cookies_to_driver(self, driver) -> None:
         """Load cookies from file into the Selenium driver."""
         try:
+            cookies = []
             with open(self.cookies_file, "r", encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
                     if not line or line.startswith("#"):
                         continue
                     parts = line.split("\t")
-                    if len(parts) >= 7:
-                        cookie = {
+                    if len(parts) >= 7 and ".youtube.com" in parts[0]:
+                        cookies.append({
                             "domain": parts[0],
                             "name": parts[5],
                             "value": parts[6],
                             "path": parts[2],
                             "secure": parts[3].lower() == "true",
-                        }
-                        if ".youtube.com" in cookie["domain"]:
-                            try:
-                                driver.add_cookie(cookie)
-                            except:
-                                pass
+                        })
+
+            if not cookies:
+                return
+
+            # Chrome can take the whole batch in one DevTools call instead
+            # of a WebDriver round-trip per cookie
+            if self.driver == "chrome":
+                try:
+                    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+                    return
+                except Exception:
+                    pass  # Fall back to per-cookie adds
+
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except:
+                    pass
         except Exception as e:
-            print(f"Warning: Could not load cookies: {e}")
+            logger.warning("Could not load cookies: %s", e)
         
     def archive_channel(
         self,
@@ -244,75 +335,94 @@ class PostArchiver:
         existing_member_ids = self._load_member_post_ids()
         
         # Pre-fetch post order from the page (captures correct mixed order)
-        print("   正在獲取貼文順序...")
+        logger.info("   正在獲取貼文順序...")
         pre_fetched_order = self._fetch_post_order_from_page(channel_url, max_posts)
         
         # Wait a bit to ensure browser is fully closed before archiver starts
         if pre_fetched_order:
             time.sleep(2)
         
-        # Archive regular posts
+        # Archive regular posts (and membership posts if requested and
+        # authenticated)
         regular_url = self._ensure_posts_url(channel_url)
-        self._run_archiver(regular_url, max_posts)
-        
-        # Archive membership posts if requested and authenticated
-        if include_membership and (self.browser_profile or self.cookies_file):
+        run_membership = include_membership and (self.browser_profile or self.cookies_file)
+
+        if run_membership and not self.browser_profile and pre_fetched_order:
+            # The two feeds are independent subprocesses; with cookies-based
+            # login they can run in parallel. A browser profile can only be
+            # opened by one browser at a time, so that case stays sequential.
+            # Parallel runs also interleave when_archived timestamps, so
+            # they are only safe when the pre-fetched page order is there
+            # to supersede the timestamp fallback.
             membership_url = self._get_membership_url(channel_url)
-            self._run_archiver(membership_url, max_posts)
-        
-        # Load all archived posts
-        posts = self.load_archived_posts()
-        
-        # Restore member status for posts that were previously marked as members
-        self._restore_member_status(posts, existing_member_ids)
+            workers = [
+                threading.Thread(target=self._run_archiver, args=(url, max_posts))
+                for url in (regular_url, membership_url)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        else:
+            self._run_archiver(regular_url, max_posts)
+            if run_membership:
+                membership_url = self._get_membership_url(channel_url)
+                self._run_archiver(membership_url, max_posts)
+
+        # The subprocesses may have added post directories
+        self._invalidate_post_paths()
         
+        # Load all archived posts, restoring member status for posts that
+        # were previously marked as members in the same walk
+        posts = self.load_archived_posts(restore_member_ids=existing_member_ids)
+
         # Update post order - use pre-fetched order if available
         self._update_post_order(posts, pre_fetched_order)
         
         return posts
     
+    def _post_json_paths(self) -> list[Path]:
+        """Return the path of every archived post.json, cached per walk."""
+        if self._post_json_paths_cache is None:
+            self._post_json_paths_cache = list(self.output_dir.rglob("post.json"))
+        return self._post_json_paths_cache
+
+    def _invalidate_post_paths(self) -> None:
+        """Drop the cached directory walk after the archive tree changed."""
+        self._post_json_paths_cache = None
+
     def _load_member_post_ids(self) -> set[str]:
         """Load IDs of posts previously marked as member-only."""
         member_ids = set()
         if not self.output_dir.exists():
             return member_ids
-        
-        for post_json in self.output_dir.rglob("post.json"):
+
+        for post_json in self._post_json_paths():
             try:
-                with open(post_json, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                raw = post_json.read_bytes()
+                # Most posts are not member-only; a C-level substring check
+                # avoids a full JSON parse for those (covering both spaced
+                # and compact serializations of the flag)
+                if b'"is_members": true' not in raw and b'"is_members":true' not in raw:
+                    continue
+                data = json_loads_bytes(raw)
                 if data.get("is_members", False):
-                    post_id = data.get("url", "").split("/")[-1]
+                    post_id = data.get("url", "").rsplit("/", 1)[-1]
                     if post_id:
                         member_ids.add(post_id)
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, OSError):
                 pass
         
         return member_ids
     
-    def _restore_member_status(self, posts: list[CommunityPost], member_ids: set[str]) -> None:
-        """Restore member status for posts and update their JSON files."""
-        for post in posts:
-            if post.post_id in member_ids and not post.is_members:
-                # Restore member status
-                post.is_members = True
-                
-                # Update the post.json file
-                post_json_path = self.output_dir / post.post_id / "post.json"
-                if post_json_path.exists():
-                    try:
-                        with open(post_json_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        data["is_members"] = True
-                        with open(post_json_path, "w", encoding="utf-8") as f:
-                            json.dump(data, f, ensure_ascii=False, indent=4)
-                    except (json.JSONDecodeError, IOError) as e:
-                        print(f"Warning: Could not update member status for {post.post_id}: {e}")
-    
-    def _update_post_order(self, posts: list[CommunityPost], pre_fetched_order: list[str] = None) -> None:
+    def _update_post_order(
+        self,
+        posts: list[CommunityPost],
+        pre_fetched_order: list[str] = None,
+    ) -> None:
         """
         Update the post_order.json file to maintain correct chronological order.
-        
+
         Args:
             posts: List of all archived posts
             pre_fetched_order: List of post IDs in correct display order (if available)
@@ -321,12 +431,13 @@ class PostArchiver:
         
         # Load existing order
         existing_order = {}
+        existing_posts = []
         if order_file.exists():
             try:
-                with open(order_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    existing_order = {item["post_id"]: item["order"] for item in data.get("posts", [])}
-            except (json.JSONDecodeError, IOError):
+                data = json_loads_bytes(order_file.read_bytes())
+                existing_posts = data.get("posts", [])
+                existing_order = {item["post_id"]: item["order"] for item in existing_posts}
+            except (ValueError, OSError):
                 pass
         
         # If we have pre-fetched order, use it as the primary source
@@ -341,17 +452,16 @@ class PostArchiver:
             posts_with_time = []
             for post in posts:
                 if post.when_archived:
-                    try:
-                        archived_dt = datetime.fromisoformat(
-                            post.when_archived.replace("+00:00", "").replace("Z", "")
-                        )
+                    archived_dt = parse_archived_timestamp(post.when_archived)
+                    if archived_dt is not None:
                         posts_with_time.append((post, archived_dt))
-                    except ValueError:
-                        pass
-            
-            # Sort by archive time (ascending = newest posts first)
-            posts_with_time.sort(key=lambda x: x[1])
             
+            # Sort by archive time (ascending = newest posts first). The
+            # list spans every archived session, and this is the only order
+            # source for posts absent from the existing order file, so all
+            # of it gets ordered — no truncation to this session's cap
+            posts_with_time.sort(key=itemgetter(1))
+
             # Assign order numbers (lower = newer)
             new_order = {}
             for idx, (post, _) in enumerate(posts_with_time):
@@ -377,28 +487,31 @@ class PostArchiver:
         final_order.sort(key=lambda x: x["order"])
         for idx, item in enumerate(final_order):
             item["order"] = idx
-        
+
+        # A no-op re-archive produces the identical order; skip the write
+        if final_order == existing_posts:
+            return
+
         # Save to file
-        with open(order_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "updated_at": datetime.now().isoformat(),
-                "posts": final_order
-            }, f, ensure_ascii=False, indent=2)
+        order_file.write_bytes(json_dumps_bytes({
+            "updated_at": datetime.now().isoformat(),
+            "posts": final_order,
+        }))
     
     def _ensure_posts_url(self, url: str) -> str:
         """Ensure the URL points to the posts page."""
         url = url.rstrip("/")
-        if not url.endswith("/posts") and not url.endswith("/community"):
+        if not url.endswith(self._POST_URL_SUFFIXES):
             if "/membership" in url:
                 return url
             url = url + "/posts"
         return url
-    
+
     def _get_membership_url(self, url: str) -> str:
         """Convert a channel URL to its membership posts URL."""
         url = url.rstrip("/")
         # Remove any existing path suffix
-        for suffix in ["/posts", "/community", "/videos", "/about", "/channels"]:
+        for suffix in self._SUFFIXES_TO_STRIP:
             if url.endswith(suffix):
                 url = url[:-len(suffix)]
                 break
@@ -426,69 +539,120 @@ class PostArchiver:
         if not self.headless:
             cmd.append("--not-headless")
         
-        print(f"Running: {' '.join(cmd)}")
+        # %s on the list defers formatting until a handler actually emits it
+        logger.debug("Running: %s", cmd)
         
         for attempt in range(max_retries + 1):
             try:
-                result = subprocess.run(
+                # Stream output line by line instead of buffering up to an
+                # hour of stdout/stderr in memory; users see live progress
+                process = subprocess.Popen(
                     cmd,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
                     text=True,
-                    timeout=3600,  # 1 hour timeout
+                    bufsize=1,
                 )
-                
-                if result.returncode == 0:
-                    if result.stdout:
-                        print(result.stdout)
+                # The read loop below blocks until the pipe closes, so the
+                # deadline has to come from outside it: a timer kills the
+                # process after an hour, which also unblocks the loop
+                timed_out = threading.Event()
+
+                def _kill_on_timeout():
+                    timed_out.set()
+                    process.kill()
+
+                watchdog = threading.Timer(3600, _kill_on_timeout)
+                watchdog.start()
+                session_lost = False
+                try:
+                    for line in process.stdout:
+                        with _print_lock:
+                            print(line, end="")
+                        if "InvalidSessionIdException" in line:
+                            session_lost = True
+                    returncode = process.wait()
+                finally:
+                    watchdog.cancel()
+
+                if timed_out.is_set():
+                    logger.error("Archiver timed out after 1 hour")
                     return
-                
+
+                if returncode == 0:
+                    return
+
                 # Check if it's a recoverable error (InvalidSessionIdException)
-                if "InvalidSessionIdException" in result.stderr:
+                if session_lost:
                     if attempt < max_retries:
-                        print(f"Warning: Browser session lost. Retrying... ({attempt + 1}/{max_retries})")
+                        logger.warning("Browser session lost. Retrying... (%d/%d)", attempt + 1, max_retries)
                         time.sleep(5)  # Wait before retry
                         continue
                     else:
-                        print(f"Error: Browser session lost after {max_retries} retries.")
-                        print("This may be due to:")
-                        print("  - Long running time causing browser timeout")
-                        print("  - Browser profile being used by another process")
-                        print("  - Insufficient memory")
-                        print("Try running with a smaller -m value to archive fewer posts at once.")
+                        logger.error(
+                            "Browser session lost after %d retries.\n"
+                            "This may be due to:\n"
+                            "  - Long running time causing browser timeout\n"
+                            "  - Browser profile being used by another process\n"
+                            "  - Insufficient memory\n"
+                            "Try running with a smaller -m value to archive fewer posts at once.",
+                            max_retries,
+                        )
                 else:
-                    print(f"Warning: Archiver returned non-zero exit code: {result.returncode}")
-                    print(f"Stderr: {result.stderr}")
-                
-                if result.stdout:
-                    print(result.stdout)
-                return
-                    
-            except subprocess.TimeoutExpired:
-                print("Error: Archiver timed out after 1 hour")
+                    logger.warning("Archiver returned non-zero exit code: %d", returncode)
                 return
+
             except FileNotFoundError:
-                print("Error: yt-community-post-archiver not found. Please install it with:")
-                print("  pip install yt-community-post-archiver")
+                logger.error(
+                    "yt-community-post-archiver not found. Please install it with:\n"
+                    "  pip install yt-community-post-archiver"
+                )
                 return
     
-    def load_archived_posts(self) -> list[CommunityPost]:
-        """Load all archived posts from the output directory."""
-        posts = []
-        
+    def load_archived_posts(
+        self,
+        restore_member_ids: Optional[set[str]] = None,
+    ) -> list[CommunityPost]:
+        """
+        Load all archived posts from the output directory.
+
+        Args:
+            restore_member_ids: IDs of posts that were previously marked as
+                member-only; matching posts are re-flagged during the same
+                walk and their post.json rewritten only when the flag changed.
+        """
         if not self.output_dir.exists():
-            return posts
-        
-        # Find all post.json files
-        for post_json in self.output_dir.rglob("post.json"):
+            return []
+        member_ids = restore_member_ids or set()
+
+        # Loading each post is independent file I/O, so parse them concurrently
+        def load_one(post_json: Path) -> Optional[CommunityPost]:
             try:
-                with open(post_json, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                raw = post_json.read_bytes()
+                data = json_loads_bytes(raw)
                 post = CommunityPost.from_json(data, post_json.parent)
-                posts.append(post)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load {post_json}: {e}")
-        
-        return posts
+                if post.post_id in member_ids and not post.is_members:
+                    # Restore member status; flipping one boolean only needs
+                    # a textual patch, not a full decode/re-encode round-trip
+                    post.is_members = True
+                    patched = _MEMBER_FALSE_RE.sub(b'"is_members": true', raw, count=1)
+                    if patched == raw:
+                        # Flag was absent entirely; fall back to a full rewrite
+                        data["is_members"] = True
+                        patched = json_dumps_bytes(data)
+                    try:
+                        post_json.write_bytes(patched)
+                    except OSError as e:
+                        logger.warning("Could not update member status for %s: %s", post.post_id, e)
+                return post
+            except (ValueError, OSError) as e:
+                logger.warning("Could not load %s: %s", post_json, e)
+                return None
+
+        post_json_paths = self._post_json_paths()
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [post for post in executor.map(load_one, post_json_paths) if post is not None]
     
     def get_posts_sorted_by_date(self, descending: bool = True) -> list[CommunityPost]:
         """
@@ -498,12 +662,11 @@ class PostArchiver:
         relative dates parsed to approximate datetime values.
         """
         posts = self.load_archived_posts()
-        
-        # Sort by estimated date (posts without dates go to the end)
-        def sort_key(post: CommunityPost):
-            if post.estimated_date:
-                return (0, post.estimated_date)
-            return (1, datetime.min)
-        
-        posts.sort(key=sort_key, reverse=descending)
-        return posts
+
+        # Decorate once with the date (datetime.min for undated posts, which
+        # sorts them to the end when descending), sort on the plain key, and
+        # strip the decoration — no per-compare key function dispatch
+        dt_min = datetime.min
+        decorated = [(post.estimated_date or dt_min, post) for post in posts]
+        decorated.sort(key=itemgetter(0), reverse=descending)
+        return [post for _, post in decorated]
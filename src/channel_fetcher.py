@@ -3,19 +3,207 @@ Channel Info Fetcher Module
 Fetches channel metadata including avatar and banner images.
 """
 
+import hashlib
 import json
 import os
 import re
+import shutil
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin
 
-import requests
+from .utils import json_dumps_bytes, json_loads_bytes
 
+# Patterns used on every channel-page parse, compiled once at import
+_RE_OG_TITLE = re.compile(r'<meta property="og:title" content="([^"]*)"')
+_RE_OG_DESC = re.compile(r'<meta property="og:description" content="([^"]*)"')
+_RE_OG_IMAGE = re.compile(r'<meta property="og:image" content="([^"]*)"')
+# Selenium banner-extraction patterns
+_RE_BANNER_JSON = re.compile(r'"banner":\s*\{"thumbnails":\s*\[(.*?)\]')
+_RE_THUMB_URL = re.compile(r'"url":\s*"([^"]+)"')
+# Bytes twins for scanning the raw page without decoding it
+_RE_BANNER_JSON_B = re.compile(rb'"banner":\s*\{"thumbnails":\s*\[(.*?)\]')
+_RE_THUMB_URL_B = re.compile(rb'"url":\s*"([^"]+)"')
 
-@dataclass
+# In-page banner lookup, run as one execute_script round-trip
+_FIND_BANNER_JS = """
+return (function () {
+    var b = document.querySelector('yt-image-banner img');
+    if (b && b.src && b.src.indexOf('yt3.googleusercontent.com') !== -1) return b.src;
+    var h = document.getElementById('page-header-banner');
+    if (h) {
+        var m = (h.getAttribute('style') || '').match(/url\\(["']?([^"')\\s]+)/);
+        if (m) return m[1];
+    }
+    var imgs = document.getElementsByTagName('img');
+    for (var i = 0; i < imgs.length; i++) {
+        var src = imgs[i].src || '';
+        if (src.indexOf('yt3.googleusercontent.com') !== -1 &&
+            (src.toLowerCase().indexOf('banner') !== -1 || src.indexOf('=w') !== -1) &&
+            imgs[i].width > 800) {
+            return src;
+        }
+    }
+    return null;
+})();
+"""
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _replace_size_token(url: str, marker: str, replacement: str) -> str:
+    """Swap a `=s<digits>-` / `=w<digits>-` size token for `replacement`.
+
+    The token shape is fixed, so a find + digit scan does the job of a
+    regex substitution.
+    """
+    i = url.find(marker)
+    if i < 0:
+        return url
+    j = i + len(marker)
+    n = len(url)
+    while j < n and url[j].isdigit():
+        j += 1
+    if j == i + len(marker) or j >= n or url[j] != "-":
+        return url
+    return url[:i] + replacement + url[j:]
+
+
+def _extract_handle(url: str) -> str:
+    """Pull the @handle out of a channel URL, or return "".
+
+    A plain character scan; the URL is short and this runs on every parse,
+    so the regex engine is overkill.
+    """
+    i = url.find("@")
+    if i < 0:
+        return ""
+    tail = url[i + 1:]
+    end = 0
+    n = len(tail)
+    while end < n and (tail[end].isalnum() or tail[end] in "_-"):
+        end += 1
+    if end == 0:
+        return ""
+    return "@" + tail[:end]
+
+
+def _deep_get(data, *path, default=""):
+    """Walk nested dicts/lists by key/index, returning `default` on any miss.
+
+    Avoids the throwaway `{}`/`[{}]` literals that chained `.get()` calls
+    allocate at every step of the navigation.
+    """
+    cur = data
+    try:
+        for key in path:
+            cur = cur[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+    return cur
+
+
+# Channel-tab path segments stripped when normalizing a channel URL
+_TAB_SUFFIXES = frozenset(
+    {"posts", "community", "membership", "videos", "about", "channels", "playlists"}
+)
+
+
+def _extract_yt_initial_data(html: str) -> Optional[dict]:
+    """
+    Locate and parse the ytInitialData JSON embedded in a YouTube page.
+
+    A plain marker search plus JSONDecoder.raw_decode consumes exactly one
+    object at the marker offset, instead of backtracking a DOTALL regex
+    across the whole multi-megabyte document.
+    """
+    for marker in ('var ytInitialData = ', '"ytInitialData":'):
+        idx = html.find(marker)
+        if idx < 0:
+            continue
+        start = idx + len(marker)
+        while start < len(html) and html[start] in " \t\r\n":
+            start += 1
+        try:
+            data, _ = _JSON_DECODER.raw_decode(html, start)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def _scan_json_object_end(raw: bytes, start: int) -> int:
+    """Return the index one past the JSON object opening at `start`, or -1.
+
+    One forward pass tracking brace depth, skipping string literals and
+    backslash escapes — O(n) with no backtracking.
+    """
+    depth = 0
+    in_string = False
+    i = start
+    n = len(raw)
+    while i < n:
+        c = raw[i]
+        if in_string:
+            if c == 0x5C:  # backslash: skip the escaped byte
+                i += 2
+                continue
+            if c == 0x22:  # closing quote
+                in_string = False
+        elif c == 0x22:
+            in_string = True
+        elif c == 0x7B:  # {
+            depth += 1
+        elif c == 0x7D:  # }
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def _initial_data_from_bytes(raw: bytes) -> Optional[dict]:
+    """
+    Extract ytInitialData from a raw response body.
+
+    Works on the undecoded bytes so only the JSON span is UTF-8 decoded.
+    The usual `};</script>` terminator gives the slice in two `find` calls;
+    when it's absent, a brace-depth scan bounds the object without decoding
+    the page. Only if both miss do we decode for the string scanner.
+    """
+    for marker in (b"var ytInitialData = ", b'"ytInitialData":'):
+        idx = raw.find(marker)
+        if idx < 0:
+            continue
+        start = idx + len(marker)
+        while start < len(raw) and raw[start] in b" \t\r\n":
+            start += 1
+        if marker[0] != 0x22:  # the script-var form usually ends the tag
+            end = raw.find(b"};</script>", start)
+            if end >= 0:
+                try:
+                    data = json_loads_bytes(raw[start:end + 1])
+                except ValueError:
+                    pass
+                else:
+                    if isinstance(data, dict):
+                        return data
+        end = _scan_json_object_end(raw, start)
+        if end > 0:
+            try:
+                data = json_loads_bytes(raw[start:end])
+            except ValueError:
+                pass
+            else:
+                if isinstance(data, dict):
+                    return data
+    return _extract_yt_initial_data(raw.decode("utf-8", "replace"))
+
+
+@dataclass(slots=True)
 class ChannelInfo:
     """Represents YouTube channel information."""
     
@@ -28,21 +216,16 @@ class ChannelInfo:
     local_avatar: str = ""
     local_banner: str = ""
     subscriber_count: str = ""
-    
+    # Validators from the last fetch, used for conditional re-fetches
+    etag: str = ""
+    last_modified: str = ""
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "channel_id": self.channel_id,
-            "name": self.name,
-            "handle": self.handle,
-            "description": self.description,
-            "avatar_url": self.avatar_url,
-            "banner_url": self.banner_url,
-            "local_avatar": self.local_avatar,
-            "local_banner": self.local_banner,
-            "subscriber_count": self.subscriber_count,
-        }
-    
+        # _CI_FIELDS is computed once at import; this stays in sync with
+        # the field list without hand-maintaining a literal
+        return {name: getattr(self, name) for name in _CI_FIELDS}
+
     @classmethod
     def from_dict(cls, data: dict) -> "ChannelInfo":
         """Create from dictionary."""
@@ -56,9 +239,15 @@ class ChannelInfo:
             local_avatar=data.get("local_avatar", ""),
             local_banner=data.get("local_banner", ""),
             subscriber_count=data.get("subscriber_count", ""),
+            etag=data.get("etag", ""),
+            last_modified=data.get("last_modified", ""),
         )
 
 
+# Field names in declaration order, for rebuilding ChannelInfo from JSON
+_CI_FIELDS = tuple(f.name for f in fields(ChannelInfo))
+
+
 class ChannelFetcher:
     """Fetches channel information from YouTube."""
     
@@ -69,6 +258,13 @@ class ChannelFetcher:
         driver: str = "chrome",
         headless: bool = True,
     ):
+        # Imported here rather than at module level: requests pulls in
+        # urllib3/charset/idna at import time, a cost every CLI start pays
+        # (including --help) if it sits at the top of the module
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.output_dir = Path(output_dir)
         self.browser_profile = browser_profile
         self.driver_type = driver
@@ -76,8 +272,26 @@ class ChannelFetcher:
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            # Compressed HTML and a kept-alive connection across the
+            # page/about/image fetches
+            "Accept-Encoding": "gzip, deflate, br",
+            "Connection": "keep-alive",
             # Don't set Accept-Language to get original channel description
         })
+        # Retry transient 5xx with backoff, and size the pool for
+        # fetch_many threads sharing it
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Fetched results keyed by normalized URL, so /posts and /community
+        # variants of the same channel don't refetch within one run
+        self._info_cache: dict = {}
     
     def fetch_channel_info(self, channel_url: str) -> Optional[ChannelInfo]:
         """
@@ -92,16 +306,56 @@ class ChannelFetcher:
         try:
             # Normalize URL to channel page
             channel_url = self._normalize_channel_url(channel_url)
-            
-            # Fetch the channel page
-            response = self.session.get(channel_url)
+
+            cached = self._info_cache.get(channel_url)
+            if cached is not None:
+                return cached
+
+            # Revalidate against the saved copy when the server gave us
+            # validators last time; a 304 skips the download and re-parse
+            saved = self.load_channel_info()
+            headers = {}
+            if saved:
+                if saved.etag:
+                    headers["If-None-Match"] = saved.etag
+                if saved.last_modified:
+                    headers["If-Modified-Since"] = saved.last_modified
+
+            # Fetch the channel page; keep the body as bytes so only the
+            # JSON slice gets decoded
+            response = self.session.get(channel_url, headers=headers or None)
+            if response.status_code == 304 and saved:
+                self._info_cache[channel_url] = saved
+                return saved
             response.raise_for_status()
-            html = response.text
-            
+            etag = response.headers.get("ETag", "")
+            last_modified = response.headers.get("Last-Modified", "")
+            raw = response.content
+            # Drop the response (and its cached body reference) so the only
+            # copy of the page is the one handed to the parser
+            del response
+
             # Extract initial data JSON
-            channel_info = self._parse_channel_page(html, channel_url)
-            
+            channel_info = self._parse_channel_page(raw, channel_url)
+
+            # Cheap bytes-level banner sweep of the page we already have,
+            # before resorting to a browser
+            if channel_info and not channel_info.banner_url:
+                banner_match = _RE_BANNER_JSON_B.search(raw)
+                if banner_match:
+                    last = None
+                    for m in _RE_THUMB_URL_B.finditer(banner_match.group(1)):
+                        last = m
+                    if last:
+                        channel_info.banner_url = self._get_high_quality_banner(
+                            last.group(1).decode("utf-8", "replace")
+                        )
+            del raw
+
             if channel_info:
+                channel_info.etag = etag
+                channel_info.last_modified = last_modified
+
                 # Fetch full description from /about page
                 about_description = self._fetch_about_description(channel_url)
                 if about_description:
@@ -118,67 +372,159 @@ class ChannelFetcher:
                 
                 # Save channel info
                 self._save_channel_info(channel_info)
-            
+
+                self._info_cache[channel_url] = channel_info
+
             return channel_info
             
         except Exception as e:
             print(f"Error fetching channel info: {e}")
             return None
     
+    def fetch_many(self, channel_urls, concurrency: int = 8) -> list:
+        """
+        Fetch info for several channels, overlapping the network waits.
+
+        URL variants of one channel share this fetcher's output_dir; a
+        batch spanning distinct channels gives each its own subdirectory,
+        because channel_info.json and the image filenames are fixed and
+        concurrent fetches into one directory would overwrite each other.
+
+        Args:
+            channel_urls: Iterable of channel URLs
+            concurrency: Upper bound on channels fetched at once
+
+        Returns:
+            List of ChannelInfo (or None per failed channel), in input order
+        """
+        urls = list(channel_urls)
+        if len(urls) <= 1:
+            return [self.fetch_channel_info(url) for url in urls]
+
+        # Fan out one fetch per distinct channel, not per input URL: the
+        # _info_cache only dedups sequential calls (it is written after a
+        # fetch completes), so submitting URL variants concurrently would
+        # run full duplicate fetches racing on the same output files
+        normalized = [self._normalize_channel_url(url) for url in urls]
+        unique = list(dict.fromkeys(normalized))
+
+        if len(unique) == 1:
+            # One channel under several URLs: a single real fetch, shared
+            # by every input position
+            info = self.fetch_channel_info(unique[0])
+            return [info] * len(urls)
+
+        fetchers: dict = {}
+        for key in unique:
+            sub = _extract_handle(key) or hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+            fetchers[key] = ChannelFetcher(
+                output_dir=str(self.output_dir / sub),
+                browser_profile=self.browser_profile,
+                driver=self.driver_type,
+                headless=self.headless,
+            )
+
+        # The work is latency-bound HTTP; threads get the overlap without
+        # an async rewrite
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique))) as executor:
+            results = executor.map(
+                lambda key: fetchers[key].fetch_channel_info(key), unique
+            )
+            by_key = dict(zip(unique, results))
+        return [by_key[key] for key in normalized]
+
+    def _about_cache_path(self, channel_url: str) -> Path:
+        """Path of the on-disk /about cache entry for a channel URL."""
+        digest = hashlib.sha1(channel_url.encode("utf-8")).hexdigest()
+        return self.output_dir / ".cache" / f"about_{digest}.json"
+
     def _fetch_about_description(self, channel_url: str) -> Optional[str]:
         """Fetch full channel description from the /about page."""
         try:
             about_url = channel_url + "/about"
-            response = self.session.get(about_url)
+
+            # The extracted description is cached on disk with the server's
+            # validators; unchanged pages cost one conditional GET instead
+            # of a multi-MB download and parse
+            cache_path = self._about_cache_path(channel_url)
+            cached = None
+            headers = {}
+            if cache_path.exists():
+                try:
+                    cached = json_loads_bytes(cache_path.read_bytes())
+                except ValueError:
+                    cached = None
+                if cached:
+                    if cached.get("etag"):
+                        headers["If-None-Match"] = cached["etag"]
+                    if cached.get("last_modified"):
+                        headers["If-Modified-Since"] = cached["last_modified"]
+
+            response = self.session.get(about_url, headers=headers or None)
+            if response.status_code == 304 and cached:
+                return cached.get("description") or None
             response.raise_for_status()
-            html = response.text
-            
+
             # Try to find ytInitialData JSON
-            match = re.search(r'var ytInitialData = ({.*?});</script>', html, re.DOTALL)
-            if not match:
-                match = re.search(r'ytInitialData"\s*:\s*({.*?})\s*[,}]</script>', html, re.DOTALL)
-            
-            if match:
-                data = json.loads(match.group(1))
-                
-                # First try: metadata.channelMetadataRenderer.description (most reliable)
-                metadata = data.get("metadata", {}).get("channelMetadataRenderer", {})
-                if metadata and metadata.get("description"):
-                    return metadata["description"]
-                
-                # Second try: Navigate to the about tab content
-                # Path: contents.twoColumnBrowseResultsRenderer.tabs[].tabRenderer.content
-                tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
-                
-                for tab in tabs:
-                    tab_renderer = tab.get("tabRenderer", {})
-                    if tab_renderer.get("title") == "About" or tab_renderer.get("selected"):
-                        content = tab_renderer.get("content", {})
-                        
-                        # Try sectionListRenderer path
-                        section_list = content.get("sectionListRenderer", {}).get("contents", [])
-                        for section in section_list:
-                            item_section = section.get("itemSectionRenderer", {}).get("contents", [])
-                            for item in item_section:
-                                # channelAboutFullMetadataRenderer contains the full description
-                                about_renderer = item.get("channelAboutFullMetadataRenderer", {})
-                                if about_renderer:
-                                    desc = about_renderer.get("description", {})
-                                    if "simpleText" in desc:
-                                        return desc["simpleText"]
-                                    elif "runs" in desc:
-                                        return "".join(run.get("text", "") for run in desc["runs"])
-                    
+            data = _initial_data_from_bytes(response.content)
+
+            description = self._about_description_from_data(data) if data else None
+            if description:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_bytes(json_dumps_bytes({
+                        "etag": response.headers.get("ETag", ""),
+                        "last_modified": response.headers.get("Last-Modified", ""),
+                        "description": description,
+                    }))
+                except OSError:
+                    pass  # the cache is best-effort
+            return description
+
         except Exception as e:
             print(f"Error fetching about page: {e}")
-        
+
+        return None
+
+    @staticmethod
+    def _about_description_from_data(data: dict) -> Optional[str]:
+        """Pull the full channel description out of /about ytInitialData."""
+        # First try: metadata.channelMetadataRenderer.description (most reliable)
+        description = _deep_get(data, "metadata", "channelMetadataRenderer", "description")
+        if description:
+            return description
+
+        # Second try: Navigate to the about tab content
+        # Path: contents.twoColumnBrowseResultsRenderer.tabs[].tabRenderer.content
+        tabs = _deep_get(data, "contents", "twoColumnBrowseResultsRenderer", "tabs", default=[])
+
+        for tab in tabs:
+            tab_renderer = tab.get("tabRenderer", {})
+            if tab_renderer.get("title") == "About" or tab_renderer.get("selected"):
+                # Try sectionListRenderer path
+                section_list = _deep_get(
+                    tab_renderer, "content", "sectionListRenderer", "contents", default=[]
+                )
+                for section in section_list:
+                    item_section = _deep_get(
+                        section, "itemSectionRenderer", "contents", default=[]
+                    )
+                    for item in item_section:
+                        # channelAboutFullMetadataRenderer contains the full description
+                        about_renderer = item.get("channelAboutFullMetadataRenderer", {})
+                        if about_renderer:
+                            desc = about_renderer.get("description", {})
+                            if "simpleText" in desc:
+                                return desc["simpleText"]
+                            elif "runs" in desc:
+                                return "".join(run.get("text", "") for run in desc["runs"])
+
         return None
     
     def _fetch_banner_with_selenium(self, channel_url: str) -> Optional[str]:
         """Fetch banner URL using Selenium for better reliability."""
         try:
             from selenium import webdriver
-            from selenium.webdriver.common.by import By
             from selenium.webdriver.chrome.options import Options as ChromeOptions
             from selenium.webdriver.firefox.options import Options as FirefoxOptions
             
@@ -203,60 +549,31 @@ class ChannelFetcher:
                 driver = webdriver.Chrome(options=options)
             
             banner_url = None
-            
+
             try:
                 driver.get(channel_url)
                 time.sleep(3)  # Wait for page to load
-                
-                # Try to find banner image
-                # Method 1: Look for yt-image-banner
+
+                # One script round-trip covers the DOM lookups; per-element
+                # get_attribute calls each cost a full driver round-trip
                 try:
-                    banner_elements = driver.find_elements(By.CSS_SELECTOR, "yt-image-banner img")
-                    for elem in banner_elements:
-                        src = elem.get_attribute("src")
-                        if src and "yt3.googleusercontent.com" in src:
-                            banner_url = src
-                            break
+                    banner_url = driver.execute_script(_FIND_BANNER_JS)
                 except:
                     pass
-                
-                # Method 2: Look for banner in style attribute
-                if not banner_url:
-                    try:
-                        banner_container = driver.find_element(By.ID, "page-header-banner")
-                        style = banner_container.get_attribute("style")
-                        if style:
-                            match = re.search(r'url\(["\']?(https://[^"\')\s]+)["\']?\)', style)
-                            if match:
-                                banner_url = match.group(1)
-                    except:
-                        pass
-                
-                # Method 3: Look for any large banner-like image
-                if not banner_url:
-                    try:
-                        imgs = driver.find_elements(By.TAG_NAME, "img")
-                        for img in imgs:
-                            src = img.get_attribute("src") or ""
-                            # Banner URLs typically have specific patterns
-                            if "yt3.googleusercontent.com" in src and ("banner" in src.lower() or "=w" in src):
-                                width = img.get_attribute("width")
-                                if width and int(width) > 800:
-                                    banner_url = src
-                                    break
-                    except:
-                        pass
-                
-                # Method 4: Extract from page source ytInitialData
+
+                # Fallback: Extract from page source ytInitialData
                 if not banner_url:
                     try:
                         page_source = driver.page_source
-                        match = re.search(r'"banner":\s*\{"thumbnails":\s*\[(.*?)\]', page_source)
+                        match = _RE_BANNER_JSON.search(page_source)
                         if match:
-                            thumbnails_str = match.group(1)
-                            url_match = re.findall(r'"url":\s*"([^"]+)"', thumbnails_str)
-                            if url_match:
-                                banner_url = url_match[-1]  # Get highest quality (last one)
+                            # Keep only the last (highest quality) URL
+                            # rather than materializing the whole list
+                            last = None
+                            for m in _RE_THUMB_URL.finditer(match.group(1)):
+                                last = m
+                            if last:
+                                banner_url = last.group(1)
                     except:
                         pass
                 
@@ -276,34 +593,35 @@ class ChannelFetcher:
     
     def _normalize_channel_url(self, url: str) -> str:
         """Normalize URL to the main channel page."""
-        url = url.rstrip("/")
-        # Remove any path suffix
-        for suffix in ["/posts", "/community", "/membership", "/videos", "/about", "/channels", "/playlists"]:
-            if url.endswith(suffix):
-                url = url[:-len(suffix)]
-                break
+        if url.endswith("/"):
+            url = url.rstrip("/")
+        # Remove any path suffix: one rpartition + set lookup instead of
+        # testing each suffix in turn
+        head, _, tail = url.rpartition("/")
+        if tail in _TAB_SUFFIXES:
+            url = head
         return url
     
-    def _parse_channel_page(self, html: str, url: str) -> Optional[ChannelInfo]:
-        """Parse the channel page HTML to extract info."""
-        
+    def _parse_channel_page(self, raw: bytes, url: str) -> Optional[ChannelInfo]:
+        """Parse the raw channel page bytes to extract info."""
+
         # Try to find ytInitialData JSON
-        match = re.search(r'var ytInitialData = ({.*?});</script>', html, re.DOTALL)
-        if not match:
-            match = re.search(r'ytInitialData"\s*:\s*({.*?})\s*[,}]</script>', html, re.DOTALL)
-        
-        if match:
-            try:
-                data = json.loads(match.group(1))
-                return self._extract_from_initial_data(data, url)
-            except json.JSONDecodeError:
-                pass
-        
-        # Fallback: Try meta tags
-        return self._extract_from_meta_tags(html, url)
+        data = _initial_data_from_bytes(raw)
+        if data:
+            # The page bytes are dead weight once the JSON is parsed; drop
+            # this frame's reference before the deep dict walk
+            del raw
+            return self._extract_from_initial_data(data, url)
+
+        # Fallback: Try meta tags (only this rare path decodes the full page)
+        return self._extract_from_meta_tags(raw.decode("utf-8", "replace"), url)
     
     def _extract_from_initial_data(self, data: dict, url: str) -> Optional[ChannelInfo]:
         """Extract channel info from ytInitialData."""
+        # Bind bound methods once; this runs on every parse and the
+        # repeated self lookups add up
+        get_hq_avatar = self._get_high_quality_avatar
+        get_hq_banner = self._get_high_quality_banner
         try:
             # Navigate to channel metadata
             metadata = None
@@ -332,43 +650,46 @@ class ChannelFetcher:
                 channel_id = metadata.get("externalId", "")
                 name = metadata.get("title", "")
                 description = metadata.get("description", "")
-                avatar_url = metadata.get("avatar", {}).get("thumbnails", [{}])[-1].get("url", "")
-            
+                avatar_url = _deep_get(metadata, "avatar", "thumbnails", -1, "url")
+
             if header:
-                if not name:
-                    name = header.get("title", "")
-                if not avatar_url:
-                    avatar_thumbnails = header.get("avatar", {}).get("thumbnails", [])
-                    if avatar_thumbnails:
-                        avatar_url = avatar_thumbnails[-1].get("url", "")
-                
-                # Banner
-                banner_data = header.get("banner", {}).get("thumbnails", [])
-                if banner_data:
-                    banner_url = banner_data[-1].get("url", "")
-                
+                # Metadata usually covers these; only fall back to the
+                # header when something is missing
+                need_header = not (name and avatar_url)
+                if need_header:
+                    if not name:
+                        name = header.get("title", "")
+                    if not avatar_url:
+                        avatar_url = _deep_get(header, "avatar", "thumbnails", -1, "url")
+
+                # Banner and subscriber count are header-only
+                banner_url = _deep_get(header, "banner", "thumbnails", -1, "url")
+
+                # pageHeaderRenderer nests the banner in a view model
+                if not banner_url:
+                    banner_url = _deep_get(
+                        header, "content", "pageHeaderViewModel", "banner",
+                        "imageBannerViewModel", "image", "sources", -1, "url",
+                    )
+
                 # TV banner (often higher quality)
-                tv_banner = header.get("tvBanner", {}).get("thumbnails", [])
+                tv_banner = _deep_get(header, "tvBanner", "thumbnails", -1, "url")
                 if tv_banner:
-                    banner_url = tv_banner[-1].get("url", "")
-                
+                    banner_url = tv_banner
+
                 # Subscriber count
-                sub_text = header.get("subscriberCountText", {}).get("simpleText", "")
-                if sub_text:
-                    subscriber_count = sub_text
+                subscriber_count = _deep_get(header, "subscriberCountText", "simpleText")
             
             # Extract handle from URL
-            handle_match = re.search(r"@([\w-]+)", url)
-            if handle_match:
-                handle = "@" + handle_match.group(1)
+            handle = _extract_handle(url)
             
             # Ensure avatar URL is high quality
             if avatar_url:
-                avatar_url = self._get_high_quality_avatar(avatar_url)
-            
+                avatar_url = get_hq_avatar(avatar_url)
+
             # Ensure banner URL is high quality
             if banner_url:
-                banner_url = self._get_high_quality_banner(banner_url)
+                banner_url = get_hq_banner(banner_url)
             
             return ChannelInfo(
                 channel_id=channel_id,
@@ -391,25 +712,22 @@ class ChannelFetcher:
         avatar_url = ""
         
         # og:title
-        match = re.search(r'<meta property="og:title" content="([^"]*)"', html)
+        match = _RE_OG_TITLE.search(html)
         if match:
             name = match.group(1)
         
         # og:description
-        match = re.search(r'<meta property="og:description" content="([^"]*)"', html)
+        match = _RE_OG_DESC.search(html)
         if match:
             description = match.group(1)
         
         # og:image (usually the avatar)
-        match = re.search(r'<meta property="og:image" content="([^"]*)"', html)
+        match = _RE_OG_IMAGE.search(html)
         if match:
             avatar_url = match.group(1)
         
         # Extract handle from URL
-        handle = ""
-        handle_match = re.search(r"@([\w-]+)", url)
-        if handle_match:
-            handle = "@" + handle_match.group(1)
+        handle = _extract_handle(url)
         
         if name or avatar_url:
             return ChannelInfo(
@@ -425,48 +743,89 @@ class ChannelFetcher:
     
     def _get_high_quality_avatar(self, url: str) -> str:
         """Convert avatar URL to high quality version."""
-        if not url:
+        # Already normalized (e.g. round-tripped through the archive)
+        if not url or "=s800-" in url:
             return url
         # YouTube avatar URLs can have size parameters, request large size
         # e.g., =s88-c-k-c0x00ffffff-no-rj -> =s800-c-k-c0x00ffffff-no-rj
-        url = re.sub(r"=s\d+-", "=s800-", url)
-        return url
+        return _replace_size_token(url, "=s", "=s800")
     
     def _get_high_quality_banner(self, url: str) -> str:
         """Convert banner URL to high quality version."""
-        if not url:
+        if not url or "=w2120-" in url:
             return url
         # Request high resolution banner
         # e.g., =w1060- -> =w2120-
-        url = re.sub(r"=w\d+-", "=w2120-", url)
-        return url
+        return _replace_size_token(url, "=w", "=w2120")
     
     def _download_images(self, channel_info: ChannelInfo) -> None:
         """Download avatar and banner images."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Download avatar
+
+        tasks = []
         if channel_info.avatar_url:
-            avatar_path = self.output_dir / "channel_avatar.jpg"
-            if self._download_image(channel_info.avatar_url, avatar_path):
-                channel_info.local_avatar = "channel_avatar.jpg"
-        
-        # Download banner
+            tasks.append(("local_avatar", channel_info.avatar_url, "channel_avatar.jpg"))
         if channel_info.banner_url:
-            banner_path = self.output_dir / "channel_banner.jpg"
-            if self._download_image(channel_info.banner_url, banner_path):
-                channel_info.local_banner = "channel_banner.jpg"
+            tasks.append(("local_banner", channel_info.banner_url, "channel_banner.jpg"))
+        if not tasks:
+            return
+
+        results = self.download_many(
+            [(url, self.output_dir / filename) for _, url, filename in tasks],
+            max_workers=2,
+        )
+        for (attr, _, filename), ok in zip(tasks, results):
+            if ok:
+                setattr(channel_info, attr, filename)
+
+    def download_many(self, items, max_workers: int = 8) -> list:
+        """
+        Download several (url, path) pairs concurrently.
+
+        The batch shares the pooled session, so the archiver can reuse this
+        for post images as well as the channel art.
+
+        Args:
+            items: Iterable of (url, destination path) pairs
+            max_workers: Upper bound on concurrent downloads
+
+        Returns:
+            List of booleans in input order, True for each success
+        """
+        items = [(url, Path(path)) for url, path in items]
+        if not items:
+            return []
+        if len(items) == 1:
+            url, path = items[0]
+            return [self._download_image(url, path)]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            futures = [executor.submit(self._download_image, url, path) for url, path in items]
+            return [future.result() for future in futures]
     
     def _download_image(self, url: str, path: Path) -> bool:
         """Download an image from URL to local path."""
         try:
-            response = self.session.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
+            # An existing file whose size matches the server's
+            # Content-Length hasn't changed; a HEAD is much cheaper than
+            # re-downloading the body
+            if path.exists():
+                try:
+                    head = self.session.head(url, allow_redirects=True)
+                    length = int(head.headers.get("Content-Length", "0"))
+                    if length and length == path.stat().st_size:
+                        return True
+                except Exception:
+                    pass  # fall through to a normal download
+
+            # Stream straight into the file; copyfileobj runs the copy loop
+            # in C with 1 MiB chunks instead of buffering the whole body
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+
             print(f"Downloaded: {path}")
             return True
             
@@ -479,9 +838,9 @@ class ChannelFetcher:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         info_path = self.output_dir / "channel_info.json"
-        with open(info_path, "w", encoding="utf-8") as f:
-            json.dump(channel_info.to_dict(), f, ensure_ascii=False, indent=2)
-        
+        # One serialized bytes blob, one write
+        info_path.write_bytes(json_dumps_bytes(channel_info.to_dict()))
+
         print(f"Saved channel info: {info_path}")
     
     def load_channel_info(self) -> Optional[ChannelInfo]:
@@ -492,9 +851,13 @@ class ChannelFetcher:
             return None
         
         try:
-            with open(info_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return ChannelInfo.from_dict(data)
+            data = json_loads_bytes(info_path.read_bytes())
+            for key in _CI_FIELDS:
+                data.setdefault(key, "")
+            if len(data) != len(_CI_FIELDS):
+                # Tolerate unknown keys from other versions of the file
+                data = {key: data[key] for key in _CI_FIELDS}
+            return ChannelInfo(**data)
         except Exception as e:
             print(f"Error loading channel info: {e}")
             return None
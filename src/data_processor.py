@@ -3,37 +3,63 @@ Data Processor Module
 Handles sorting and organizing community posts.
 """
 
+import bisect
 import json
+import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
 from .archiver import CommunityPost
+from .utils import parse_archived_timestamp
 from .channel_fetcher import ChannelInfo
 
 
 @dataclass
 class ProcessedData:
     """Container for all processed archive data."""
-    
+
     channel_info: Optional[ChannelInfo]
-    posts: list[CommunityPost]
-    member_posts: list[CommunityPost]
     all_posts_sorted: list[CommunityPost]
     archive_date: datetime
-    
-    @property
+
+    # Instances are built once per process_all and read-only afterwards,
+    # so the membership split and the counts can freeze on first access;
+    # callers that only render the sorted list never pay for the split
+    @cached_property
+    def member_posts(self) -> list[CommunityPost]:
+        return [p for p in self.all_posts_sorted if p.is_members]
+
+    @cached_property
+    def posts(self) -> list[CommunityPost]:
+        return [p for p in self.all_posts_sorted if not p.is_members]
+
+    @cached_property
     def total_posts(self) -> int:
         return len(self.all_posts_sorted)
-    
-    @property
+
+    @cached_property
     def member_only_count(self) -> int:
         return len(self.member_posts)
-    
-    @property
+
+    @cached_property
     def public_count(self) -> int:
-        return len(self.posts)
+        return self.total_posts - self.member_only_count
+
+
+# Added to estimated-date sort keys so they rank after any real archive
+# timestamp (always < 1e10) without losing sub-second resolution
+_ESTIMATED_TIER = 1e10
+
+
+@lru_cache(maxsize=256)
+def _compile_search_any(terms: tuple[str, ...]):
+    """Compile an OR-alternation for multi-term search, memoized so a
+    repeated query set skips the re.compile."""
+    return re.compile("|".join(map(re.escape, terms)))
 
 
 class DataProcessor:
@@ -41,7 +67,9 @@ class DataProcessor:
     
     def __init__(self, output_dir: str = "archive-output"):
         self.output_dir = Path(output_dir)
-    
+        # post_order.json parsed once per processor; repeated sorts reuse it
+        self._post_order_cache: Optional[dict[str, int]] = None
+
     def process_all(
         self,
         posts: list[CommunityPost],
@@ -57,32 +85,33 @@ class DataProcessor:
         Returns:
             ProcessedData object with organized posts
         """
-        # Separate member and public posts
-        member_posts = [p for p in posts if p.is_members]
-        public_posts = [p for p in posts if not p.is_members]
-        
-        # Sort all posts by order
+        # Sort all posts by order; the member/public split happens lazily
+        # on the ProcessedData if anything asks for it
         all_sorted = self._sort_by_order(posts)
-        
+
         return ProcessedData(
             channel_info=channel_info,
-            posts=public_posts,
-            member_posts=member_posts,
             all_posts_sorted=all_sorted,
             archive_date=datetime.now(),
         )
     
     def _load_post_order(self) -> dict[str, int]:
         """Load post order from post_order.json if it exists."""
+        if self._post_order_cache is not None:
+            return self._post_order_cache
+
+        order: dict[str, int] = {}
         order_file = self.output_dir / "post_order.json"
         if order_file.exists():
             try:
                 with open(order_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                    return {item["post_id"]: item["order"] for item in data.get("posts", [])}
+                    order = {item["post_id"]: item["order"] for item in data.get("posts", [])}
             except (json.JSONDecodeError, IOError):
                 pass
-        return {}
+
+        self._post_order_cache = order
+        return order
     
     def _sort_by_order(
         self,
@@ -97,14 +126,15 @@ class DataProcessor:
         post_order = self._load_post_order()
         
         if post_order:
-            # Use recorded order (lower number = newer post)
-            def get_sort_key(post: CommunityPost):
-                if post.post_id in post_order:
-                    return (0, post_order[post.post_id])
-                # Posts not in order file go to the end
-                return (1, 0)
-            
-            return sorted(posts, key=get_sort_key, reverse=not newest_first)
+            # Use recorded order (lower number = newer post). Keys are
+            # computed up front so the sort compares plain int tuples;
+            # posts not in the order file go to the end
+            decorated = [
+                ((0, post_order[post.post_id]) if post.post_id in post_order else (1, 0), post)
+                for post in posts
+            ]
+            decorated.sort(key=itemgetter(0), reverse=not newest_first)
+            return [post for _, post in decorated]
         else:
             # Fall back to when_archived sorting
             return self._sort_by_date(posts, newest_first)
@@ -130,30 +160,59 @@ class DataProcessor:
         Returns:
             Sorted list of posts
         """
-        def get_sort_key(post: CommunityPost):
+        # Decorate-sort-undecorate: compute each key once (the cached
+        # timestamp parse in particular) instead of during every comparison.
+        # Each key is a single POSIX float so the sort compares native
+        # numbers rather than dispatching datetime.__lt__; the tier offset
+        # keeps estimated dates after every archived timestamp while leaving
+        # second-level precision intact
+        decorated = []
+        for post in posts:
             # Primary: use archive timestamp as it reflects page order
             # Earlier archived = newer post (was at top of page)
-            if post.when_archived:
-                try:
-                    # Parse ISO format timestamp
-                    archived_dt = datetime.fromisoformat(
-                        post.when_archived.replace("+00:00", "").replace("Z", "")
-                    )
-                    return (0, archived_dt)
-                except ValueError:
-                    pass
-            
-            # Secondary: estimated date from relative date (less accurate)
-            if post.estimated_date:
-                return (1, post.estimated_date)
-            
-            # Fallback: use a very old date to sort at end
-            return (2, datetime.min)
-        
+            archived_dt = parse_archived_timestamp(post.when_archived) if post.when_archived else None
+            if archived_dt is not None:
+                key = archived_dt.timestamp()
+            elif post.estimated_date:
+                # Secondary: estimated date from relative date (less accurate)
+                key = _ESTIMATED_TIER + post.estimated_date.timestamp()
+            else:
+                # Fallback: sorts at the end
+                key = float("inf")
+            decorated.append((key, post))
+
         # Earlier when_archived = newer post, so ascending order gives newest first
         # reverse=True means oldest first (larger timestamps first)
-        return sorted(posts, key=get_sort_key, reverse=not newest_first)
+        decorated.sort(key=itemgetter(0), reverse=not newest_first)
+        return [post for _, post in decorated]
     
+    def filter_by_date_range_iter(
+        self,
+        posts,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        """
+        Lazily filter posts by date range.
+
+        Streaming counterpart of :meth:`filter_by_date_range` for chaining
+        with the other ``*_iter`` filters; it scans linearly, so only the
+        undated posts (yielded last) are buffered. Use the list method when
+        the input is a presorted list — it can bisect the window instead.
+        """
+        undated = []
+        for post in posts:
+            d = post.estimated_date
+            if not d:
+                undated.append(post)
+                continue
+            if start_date and d < start_date:
+                continue
+            if end_date and d > end_date:
+                continue
+            yield post
+        yield from undated
+
     def filter_by_date_range(
         self,
         posts: list[CommunityPost],
@@ -162,32 +221,79 @@ class DataProcessor:
     ) -> list[CommunityPost]:
         """
         Filter posts by date range.
-        
+
         Args:
             posts: List of posts to filter
             start_date: Only include posts on or after this date
             end_date: Only include posts on or before this date
-            
+
         Returns:
-            Filtered list of posts
+            Filtered list of posts; posts without dates are always
+            included, after the dated ones
         """
-        filtered = []
-        
+        if start_date is None and end_date is None:
+            return list(posts)
+
+        # Split off the undated posts (always included) and note whether the
+        # dated ones arrive already sorted, as they do straight out of
+        # _sort_by_date
+        dated: list[CommunityPost] = []
+        dates: list[datetime] = []
+        undated: list[CommunityPost] = []
+        ascending = descending = True
+        prev = None
         for post in posts:
-            if not post.estimated_date:
-                # Include posts without dates
-                filtered.append(post)
+            d = post.estimated_date
+            if not d:
+                undated.append(post)
                 continue
-            
-            if start_date and post.estimated_date < start_date:
+            if prev is not None:
+                if d < prev:
+                    ascending = False
+                elif d > prev:
+                    descending = False
+            prev = d
+            dated.append(post)
+            dates.append(d)
+
+        # Presorted input: two bisects pick the window instead of two
+        # comparisons per post
+        if dated and ascending:
+            lo = bisect.bisect_left(dates, start_date) if start_date else 0
+            hi = bisect.bisect_right(dates, end_date) if end_date else len(dates)
+            return dated[lo:hi] + undated
+        if dated and descending:
+            dates.reverse()
+            lo = bisect.bisect_left(dates, start_date) if start_date else 0
+            hi = bisect.bisect_right(dates, end_date) if end_date else len(dates)
+            n = len(dated)
+            return dated[n - hi:n - lo] + undated
+
+        # Unsorted input: linear scan, with the undated posts appended at
+        # the end like the bisect paths
+        filtered = []
+        for post in dated:
+            d = post.estimated_date
+            if start_date and d < start_date:
                 continue
-            if end_date and post.estimated_date > end_date:
+            if end_date and d > end_date:
                 continue
-            
             filtered.append(post)
-        
+
+        filtered.extend(undated)
         return filtered
     
+    def filter_members_only_iter(
+        self,
+        posts,
+        include_members: bool = True,
+        include_public: bool = True,
+    ):
+        """Lazily filter posts by membership status."""
+        for post in posts:
+            if include_members if post.is_members else include_public:
+                yield post
+
     def filter_members_only(
         self,
         posts: list[CommunityPost],
@@ -196,25 +302,28 @@ class DataProcessor:
     ) -> list[CommunityPost]:
         """
         Filter posts by membership status.
-        
+
         Args:
             posts: List of posts to filter
             include_members: Include member-only posts
             include_public: Include public posts
-            
+
         Returns:
             Filtered list of posts
         """
-        filtered = []
-        
-        for post in posts:
-            if post.is_members and include_members:
-                filtered.append(post)
-            elif not post.is_members and include_public:
-                filtered.append(post)
-        
-        return filtered
-    
+        return list(self.filter_members_only_iter(posts, include_members, include_public))
+
+    def search_posts_iter(self, posts, query: str):
+        """Lazily search posts by text content (case-insensitive).
+
+        Repeated searches are cheap: text_lower is lowercased once per
+        post and cached on the instance.
+        """
+        query = query.lower()
+        for p in posts:
+            if query in p.text_lower:
+                yield p
+
     def search_posts(
         self,
         posts: list[CommunityPost],
@@ -222,30 +331,64 @@ class DataProcessor:
     ) -> list[CommunityPost]:
         """
         Search posts by text content.
-        
+
         Args:
             posts: List of posts to search
             query: Search query (case-insensitive)
-            
+
         Returns:
             List of posts matching the query
         """
-        query = query.lower()
-        return [p for p in posts if query in p.text.lower()]
+        return list(self.search_posts_iter(posts, query))
+
+    def search_posts_any(
+        self,
+        posts: list[CommunityPost],
+        queries: list[str],
+    ) -> list[CommunityPost]:
+        """
+        Search posts matching any of several terms.
+
+        One compiled alternation scans each post once, instead of one
+        substring pass per term.
+
+        Args:
+            posts: List of posts to search
+            queries: Search terms (case-insensitive, OR semantics)
+
+        Returns:
+            List of posts matching at least one term
+        """
+        terms = [q.lower() for q in queries if q]
+        if not terms:
+            return []
+        if len(terms) == 1:
+            return self.search_posts(posts, terms[0])
+
+        search = _compile_search_any(tuple(terms)).search
+        return [p for p in posts if search(p.text_lower)]
     
+    def get_posts_with_polls_iter(self, posts):
+        """Lazily select posts that contain polls."""
+        return (p for p in posts if p.has_poll)
+
     def get_posts_with_polls(
         self,
         posts: list[CommunityPost],
     ) -> list[CommunityPost]:
         """Get only posts that contain polls."""
-        return [p for p in posts if p.poll is not None]
-    
+        return list(self.get_posts_with_polls_iter(posts))
+
+    def get_posts_with_images_iter(self, posts):
+        """Lazily select posts that contain images."""
+        return (p for p in posts if p.has_image)
+
     def get_posts_with_images(
         self,
         posts: list[CommunityPost],
     ) -> list[CommunityPost]:
         """Get only posts that contain images."""
-        return [p for p in posts if p.images or p.local_images]
+        return list(self.get_posts_with_images_iter(posts))
     
     def get_statistics(self, posts: list[CommunityPost]) -> dict:
         """
@@ -254,16 +397,25 @@ class DataProcessor:
         Returns:
             Dictionary with various statistics
         """
+        # All counters and the date range come out of one walk over the
+        # list instead of five separate passes
         total = len(posts)
-        members_only = sum(1 for p in posts if p.is_members)
-        with_images = sum(1 for p in posts if p.images or p.local_images)
-        with_polls = sum(1 for p in posts if p.poll is not None)
-        
-        # Date range
-        dates = [p.estimated_date for p in posts if p.estimated_date]
-        oldest = min(dates) if dates else None
-        newest = max(dates) if dates else None
-        
+        members_only = with_images = with_polls = 0
+        oldest = newest = None
+        for p in posts:
+            if p.is_members:
+                members_only += 1
+            if p.has_image:
+                with_images += 1
+            if p.has_poll:
+                with_polls += 1
+            d = p.estimated_date
+            if d is not None:
+                if oldest is None or d < oldest:
+                    oldest = d
+                if newest is None or d > newest:
+                    newest = d
+
         return {
             "total_posts": total,
             "members_only": members_only,
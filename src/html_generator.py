@@ -3,19 +3,43 @@ HTML Generator Module
 Generates static HTML pages for viewing archived community posts.
 """
 
-import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 
 from .archiver import CommunityPost
 from .channel_fetcher import ChannelInfo
 from .data_processor import ProcessedData
-from .utils import format_text_with_links
+from .utils import format_text_with_links, json_dumps_compact_bytes
+
+
+# Image types the archiver can produce; frozenset membership is O(1) per file
+_IMG_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Hardlink `src` to `dst`, falling back to a real copy.
+
+    The viewer normally lives on the same filesystem as the archive, so a
+    link is one inode operation regardless of image size. The images are
+    write-once, so sharing the inode is safe.
+    """
+    try:
+        if dst.exists():
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 class HTMLGenerator:
@@ -25,10 +49,17 @@ class HTMLGenerator:
         self.output_dir = Path(output_dir)
         self.template_dir = Path(__file__).parent / "templates"
         
-        # Create Jinja2 environment
+        # Create Jinja2 environment. Templates only change with the code,
+        # so skip the mtime check on each lookup and keep compiled bytecode
+        # on disk — repeated --generate-only runs then skip parse/compile.
+        # The cache directory is only created once generate() runs, so
+        # constructing the generator leaves the filesystem untouched
+        self._bytecode_cache_dir = self.output_dir / ".jinja_cache"
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(directory=str(self._bytecode_cache_dir)),
         )
         
         # Add custom filters
@@ -36,10 +67,14 @@ class HTMLGenerator:
         self.env.filters["format_date"] = self._format_date
     
     def _format_date(self, dt: Optional[datetime]) -> str:
-        """Format datetime for display."""
+        """Format datetime for display.
+
+        Runs once per post during render, so it formats the fields
+        directly instead of going through strftime's spec parsing.
+        """
         if not dt:
             return "Unknown"
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
     
     def generate(self, data: ProcessedData) -> Path:
         """
@@ -54,6 +89,7 @@ class HTMLGenerator:
         # Create output directory
         html_dir = self.output_dir / "viewer"
         html_dir.mkdir(parents=True, exist_ok=True)
+        self._bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy static assets
         self._copy_static_assets(html_dir)
@@ -78,20 +114,42 @@ class HTMLGenerator:
         posts_images_dir = assets_dir / "posts"
         posts_images_dir.mkdir(exist_ok=True)
         
-        # Copy channel images if they exist
+        # Collect every (src, dst) pair first, creating directories up
+        # front, then run the copies on a thread pool — each copy is a
+        # bundle of syscalls that overlap well
+        pairs: list[tuple[Path, Path]] = []
+
         for img_name in ["channel_avatar.jpg", "channel_banner.jpg"]:
             src = self.output_dir / img_name
             if src.exists():
-                shutil.copy2(src, assets_dir / img_name)
-        
-        # Copy all post images
+                pairs.append((src, assets_dir / img_name))
+
+        # Dot-directories (.jinja_cache, the fetcher's .cache) are run
+        # metadata, not post directories
         for post_dir in self.output_dir.iterdir():
-            if post_dir.is_dir() and post_dir.name not in ["viewer", "assets"]:
+            if (
+                post_dir.is_dir()
+                and not post_dir.name.startswith(".")
+                and post_dir.name not in ["viewer", "assets"]
+            ):
                 dest_dir = posts_images_dir / post_dir.name
                 dest_dir.mkdir(exist_ok=True)
                 for img in post_dir.glob("*"):
-                    if img.suffix.lower() in [".jpg", ".jpeg", ".png", ".webp", ".gif"]:
-                        shutil.copy2(img, dest_dir / img.name)
+                    if img.suffix.lower() in _IMG_EXTS:
+                        pairs.append((img, dest_dir / img.name))
+
+        if not pairs:
+            return
+
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(pairs))
+        if max_workers <= 1:
+            for src, dst in pairs:
+                _fast_copy(src, dst)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(lambda pair: _fast_copy(*pair), pairs):
+                pass
     
     def _generate_index(self, data: ProcessedData, html_dir: Path) -> Path:
         """Generate the main index.html file."""
@@ -106,17 +164,20 @@ class HTMLGenerator:
                 "public": data.public_count,
                 "members": data.member_only_count,
             },
-            "archive_date": data.archive_date.strftime("%Y-%m-%d %H:%M"),
+            "archive_date": self._format_date(data.archive_date),
             "has_avatar": data.channel_info and data.channel_info.local_avatar,
             "has_banner": data.channel_info and data.channel_info.local_banner,
         }
         
-        html_content = template.render(**template_data)
-        
+        # Stream the render straight to disk in buffered chunks instead of
+        # building the whole page (which scales with post count) as one
+        # string first
         index_path = html_dir / "index.html"
+        stream = template.stream(**template_data)
+        stream.enable_buffering()
         with open(index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        
+            stream.dump(f)
+
         return index_path
     
     def _generate_posts_json(self, data: ProcessedData, html_dir: Path) -> None:
@@ -137,6 +198,7 @@ class HTMLGenerator:
                 "poll": post.poll,
             })
         
+        # The file is only read by the viewer's JS, so serialize compactly
+        # in one bytes blob and one write
         json_path = html_dir / "assets" / "posts.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(posts_data, f, ensure_ascii=False, indent=2)
+        json_path.write_bytes(json_dumps_compact_bytes(posts_data))
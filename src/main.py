@@ -4,6 +4,7 @@ Main entry point and CLI interface.
 """
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
@@ -16,6 +17,10 @@ from .html_generator import HTMLGenerator
 
 def main():
     """Main entry point for the CLI."""
+    # Module loggers carry the progress/warning output; keep the CLI format
+    # bare so it reads like plain console output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(
         description="Archive YouTube community posts and generate a static HTML viewer.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2,69 +2,115 @@
 Utility functions for the YouTube Community Post Viewer.
 """
 
+import functools
+import json
 import re
 from datetime import datetime, timedelta
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+def json_loads_bytes(raw: bytes):
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def json_dumps_compact_bytes(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, preferring orjson.
+
+    For machine-read payloads where indentation is wasted bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Filename characters invalid on common filesystems, mapped to "_"
+_SANITIZE_TBL = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# URLs in post text, converted to anchors per post during generation
+_URL_RE = re.compile(r'(https?://[^\s<>"\']+)')
+
+# The three channel-URL shapes folded into one alternation
+_CHANNEL_HANDLE_RE = re.compile(r"youtube\.com/(?:(@[\w-]+)|c/([\w-]+)|channel/([\w-]+))")
+
+# Relative-date phrases: value and unit captured in one search
+_REL_DATE_RE = re.compile(r"(\d+)\s*(second|minute|hour|day|week|month|year)")
+
+# Seconds per unit, so the offset is one multiply; months and years use
+# the same 30/365-day approximations as before
+_UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,
+    "year": 31536000,
+}
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_archived_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse a when_archived ISO timestamp, dropping any UTC offset marker.
+
+    Memoized because the archiver and the processor both key sorts on the
+    same timestamps, post counts can be large, and the strings repeat.
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace("+00:00", "").replace("Z", ""))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_relative_date(relative_date: str) -> Optional[datetime]:
     """
     Parse a relative date string (e.g., "3 months ago") to an approximate datetime.
-    
+
     Note: Since YouTube only provides relative dates, the returned datetime is an
     approximation based on the current time when this function is called.
-    
+    Results are cached since the same strings repeat across many posts and the
+    value is already only an approximation.
+
     Args:
         relative_date: A string like "3 months ago", "1 year ago", "2 weeks ago"
-        
+
     Returns:
         An approximate datetime, or None if parsing fails
     """
     if not relative_date:
         return None
-    
+
     relative_date = relative_date.lower().strip()
     now = datetime.now()
-    
-    # Pattern to match relative date strings
-    patterns = [
-        (r"(\d+)\s*second", "seconds"),
-        (r"(\d+)\s*minute", "minutes"),
-        (r"(\d+)\s*hour", "hours"),
-        (r"(\d+)\s*day", "days"),
-        (r"(\d+)\s*week", "weeks"),
-        (r"(\d+)\s*month", "months"),
-        (r"(\d+)\s*year", "years"),
-    ]
-    
-    for pattern, unit in patterns:
-        match = re.search(pattern, relative_date)
-        if match:
-            value = int(match.group(1))
-            
-            if unit == "seconds":
-                return now - timedelta(seconds=value)
-            elif unit == "minutes":
-                return now - timedelta(minutes=value)
-            elif unit == "hours":
-                return now - timedelta(hours=value)
-            elif unit == "days":
-                return now - timedelta(days=value)
-            elif unit == "weeks":
-                return now - timedelta(weeks=value)
-            elif unit == "months":
-                # Approximate: 30 days per month
-                return now - timedelta(days=value * 30)
-            elif unit == "years":
-                # Approximate: 365 days per year
-                return now - timedelta(days=value * 365)
-    
+
+    # One alternation finds the value and unit together instead of probing
+    # seven patterns in turn
+    match = _REL_DATE_RE.search(relative_date)
+    if match:
+        value = int(match.group(1))
+        return now - timedelta(seconds=value * _UNIT_SECONDS[match.group(2)])
+
     # Handle special cases
     if "just now" in relative_date or "moments ago" in relative_date:
         return now
     if "yesterday" in relative_date:
         return now - timedelta(days=1)
-    
+
     return None
 
 
@@ -78,18 +124,14 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         A sanitized filename safe for most filesystems
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-    
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(" .")
-    
+    # Replace invalid characters in one table-driven pass, then trim
+    # leading/trailing spaces and dots
+    filename = filename.translate(_SANITIZE_TBL).strip(" .")
+
     # Limit length
     if len(filename) > 200:
         filename = filename[:200]
-    
+
     return filename or "untitled"
 
 
@@ -116,21 +158,11 @@ def extract_channel_handle(url: str) -> Optional[str]:
     Returns:
         The channel handle (e.g., "@ChannelName") or None
     """
-    # Match @handle format
-    match = re.search(r"youtube\.com/(@[\w-]+)", url)
+    # @handle, /c/name and /channel/ID checked in a single scan
+    match = _CHANNEL_HANDLE_RE.search(url)
     if match:
-        return match.group(1)
-    
-    # Match /c/channelname format
-    match = re.search(r"youtube\.com/c/([\w-]+)", url)
-    if match:
-        return match.group(1)
-    
-    # Match /channel/ID format
-    match = re.search(r"youtube\.com/channel/([\w-]+)", url)
-    if match:
-        return match.group(1)
-    
+        return match.group(1) or match.group(2) or match.group(3)
+
     return None
 
 
@@ -150,9 +182,7 @@ def format_text_with_links(text: str) -> str:
     text = html.escape(text)
     
     # Convert URLs to links
-    url_pattern = r'(https?://[^\s<>"\']+)'
-    text = re.sub(
-        url_pattern,
+    text = _URL_RE.sub(
         r'<a href="\1" target="_blank" rel="noopener noreferrer">\1</a>',
         text
     )